@@ -10,8 +10,14 @@ BANDWIDTH_OPTIONS = {
 }
 
 # Parse command line arguments
-if len(sys.argv) > 1:
-    bandwidth_mode = sys.argv[1].lower()
+# --pareto ranks by enhanced rating, legacy rating and worst single hit together
+args = sys.argv[1:]
+pareto_mode = '--pareto' in args
+if pareto_mode:
+    args.remove('--pareto')
+
+if args:
+    bandwidth_mode = args[0].lower()
     if bandwidth_mode in BANDWIDTH_OPTIONS:
         channel_width = BANDWIDTH_OPTIONS[bandwidth_mode]
         print(f"Using {bandwidth_mode} mode with {channel_width} MHz bandwidth")
@@ -24,7 +30,7 @@ else:
     bandwidth_mode = 'analog'
     channel_width = 17
     print(f"Using default analog mode with {channel_width} MHz bandwidth")
-    print(f"Usage: python app.py [mode]")
+    print(f"Usage: python app.py [mode] [--pareto]")
     print(f"Available modes: {', '.join(BANDWIDTH_OPTIONS.keys())}")
 
 # FPV Band Frequencies (in MHz) with channel numbers
@@ -107,14 +113,31 @@ print(f"Total combinations: {len(valid_combinations)}")
 
 # calc rating for all combinations
 ratings = []
+legacy_ratings = {}
+pareto_front = []
 for combination in valid_combinations:
-    rating = imd.calcRating(combination)
+    if pareto_mode:
+        # One fused pass gives all three objectives; keep the front up to date as we scan
+        objectives = imd.calcObjectives(combination)
+        rating = objectives[0]
+        legacy_ratings[tuple(combination)] = objectives[1]
+        imd.update_pareto_front(pareto_front, objectives, combination)
+    else:
+        rating = imd.calcRating(combination)
     ratings.append((rating, combination))
     # print(f"Rating: {rating} - {combination}")
 
 # sort ratings
 ratings.sort(key=lambda x: x[0], reverse=True)
 
+
+def get_legacy_rating(combination):
+    # Reuse the legacy rating from the fused pass when available
+    legacy_rating = legacy_ratings.get(tuple(combination))
+    if legacy_rating is None:
+        legacy_rating = imd.calcRating_legacy(combination)
+    return legacy_rating
+
 # Create frequency to band/channel mapping for display
 freq_to_band_ch = {}
 for band_name, band_data in fpv_bands.items():
@@ -123,12 +146,25 @@ for band_name, band_data in fpv_bands.items():
             freq_to_band_ch[freq] = []
         freq_to_band_ch[freq].append((band_name, ch))
 
+# display Pareto shortlist (enhanced rating, legacy rating, worst single hit)
+if pareto_mode:
+    pareto_front.sort(key=lambda x: (-x[0][0], -x[0][1], x[0][2]))
+    print(f"\nPareto-optimal combinations: {len(pareto_front)}")
+    print("Enhanced and Legacy ratings are maximized, Worst single hit is minimized.")
+    for i, ((rating, legacy_rating, worst), combination) in enumerate(pareto_front, 1):
+        band_info = []
+        for freq in combination:
+            band_ch_list = freq_to_band_ch.get(freq, [('?', '?')])
+            band_ch_str = '/'.join([f"{b}{ch}" for b, ch in band_ch_list])
+            band_info.append(f"{freq}MHz({band_ch_str})")
+        print(f"{i}. Rating: {rating} (Legacy: {legacy_rating}, Worst: {worst:.2f}) - {', '.join(band_info)}")
+
 # display top 10 ratings with comparison to legacy
 print("\nTop 10 FPV frequency combinations (Enhanced IMD Analysis):")
 print("Note: Enhanced and Legacy ratings use different calculation methods and cannot be directly compared.")
 for i, (rating, combination) in enumerate(ratings[:10], 1):
     band_info = []
-    legacy_rating = imd.calcRating_legacy(combination)
+    legacy_rating = get_legacy_rating(combination)
     for freq in combination:
         band_ch_list = freq_to_band_ch.get(freq, [('?', '?')])
         band_ch_str = '/'.join([f"{b}{ch}" for b, ch in band_ch_list])
@@ -263,7 +299,7 @@ best_combination = ratings[0][1]
 imd_details = imd.analyze_imd_details(best_combination)
 
 print(f"Frequencies: {best_combination}")
-print(f"Enhanced Rating: {ratings[0][0]}, Legacy Rating: {imd.calcRating_legacy(best_combination)}")
+print(f"Enhanced Rating: {ratings[0][0]}, Legacy Rating: {get_legacy_rating(best_combination)}")
 
 # Count significant IMD products
 significant_imd_count = {
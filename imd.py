@@ -139,7 +139,11 @@ def calculate_weighted_interference(imd_freq: int, frequencies: list, weight: fl
     """Calculate weighted interference score for a single IMD product"""
     nearest = findNearestFrequency(imd_freq, frequencies)
     difference = abs(imd_freq - nearest)
-    
+    return calculate_weighted_interference_from_separation(difference, weight, threshold)
+
+
+def calculate_weighted_interference_from_separation(difference: int, weight: float, threshold: int):
+    """Calculate weighted interference score from an already known separation"""
     if difference > threshold:
         return 0
     
@@ -228,6 +232,102 @@ def calcRating_legacy(frequencies: list):
     return round(RATING_MAX_VALUE - total / 5 / n)
 
 
+def calcObjectives(frequencies: list):
+    """Calculate enhanced rating, legacy rating and worst single hit in one pass
+
+    Produces the same values as calcRating, calcRating_legacy and the highest
+    interference_score reported by analyze_imd_details, but generates every
+    IMD product and looks up its nearest channel only once. The 2nd order
+    products are shared between the enhanced and legacy ratings.
+    Returns: (enhanced_rating, legacy_rating, worst_interference)
+    """
+    n = len(frequencies)
+    total_interference = 0
+    legacy_total = 0
+    worst_interference = 0
+    
+    # 2nd order IMD (shared with legacy rating)
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            
+            imd_products = calculate_2nd_order_imd(frequencies[i], frequencies[j])
+            for imd in imd_products:
+                if not isValidFrequency(imd):
+                    continue
+                difference = abs(imd - findNearestFrequency(imd, frequencies))
+                interference = calculate_weighted_interference_from_separation(
+                    difference, WEIGHT_2ND_ORDER, THRESHOLD_2ND_ORDER
+                )
+                total_interference += interference
+                worst_interference = max(worst_interference, interference)
+                if difference <= RATING_DIFF_LIMIT:
+                    value = RATING_DIFF_LIMIT - difference
+                    legacy_total += value * value
+    
+    # 3rd order IMD (2 frequencies)
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            
+            imd_products = calculate_3rd_order_imd_2freq(frequencies[i], frequencies[j])
+            for imd in imd_products:
+                interference = calculate_weighted_interference(
+                    imd, frequencies, WEIGHT_3RD_ORDER_2FREQ, THRESHOLD_3RD_ORDER
+                )
+                total_interference += interference
+                worst_interference = max(worst_interference, interference)
+    
+    # 3rd order IMD (3 frequencies)
+    for i in range(n):
+        for j in range(i + 1, n):
+            for k in range(j + 1, n):
+                imd_products = calculate_3rd_order_imd_3freq(
+                    frequencies[i], frequencies[j], frequencies[k]
+                )
+                for imd in imd_products:
+                    interference = calculate_weighted_interference(
+                        imd, frequencies, WEIGHT_3RD_ORDER_3FREQ, THRESHOLD_3RD_ORDER
+                    )
+                    total_interference += interference
+                    worst_interference = max(worst_interference, interference)
+    
+    # Same normalization as calcRating and calcRating_legacy
+    rating = max(0, round(RATING_MAX_VALUE - total_interference / (15 * n)))
+    legacy_rating = round(RATING_MAX_VALUE - legacy_total / 5 / n)
+    
+    return rating, legacy_rating, worst_interference
+
+
+def dominates(a: tuple, b: tuple):
+    """Check whether objectives a Pareto-dominate objectives b
+
+    Objectives are (enhanced_rating, legacy_rating, worst_interference) as
+    returned by calcObjectives: ratings are maximized, worst hit is minimized.
+    """
+    not_worse = a[0] >= b[0] and a[1] >= b[1] and a[2] <= b[2]
+    better = a[0] > b[0] or a[1] > b[1] or a[2] < b[2]
+    return not_worse and better
+
+
+def update_pareto_front(front: list, objectives: tuple, combination: list):
+    """Insert a combination into a Pareto front of (objectives, combination) entries
+
+    The front is updated in place: the new entry is dropped if it is dominated,
+    otherwise any entries it dominates are removed. Entries with identical
+    objectives are all kept.
+    Returns: True if the combination was added to the front
+    """
+    for existing, _ in front:
+        if dominates(existing, objectives):
+            return False
+    front[:] = [entry for entry in front if not dominates(objectives, entry[0])]
+    front.append((objectives, combination))
+    return True
+
+
 def analyze_imd_details(frequencies: list):
     """Analyze and return detailed IMD information for visualization"""
     results = {
@@ -341,6 +441,7 @@ if __name__ == "__main__":
     print("Test frequencies:", test_freqs)
     print("Enhanced rating:", calcRating(test_freqs))
     print("Legacy rating:", calcRating_legacy(test_freqs))
+    print("Objectives (enhanced, legacy, worst hit):", calcObjectives(test_freqs))
     
     # Show detailed analysis
     print("\nDetailed IMD Analysis:")